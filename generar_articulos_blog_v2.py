@@ -10,25 +10,42 @@ Características:
 - Cada heading ### genera 1 artículo.
 - category = "<archivo>, <H1 actual>, <H2 actual>"
 - Dedupe por (title, category)
-- Cache en .cache_articulos/
+- Cache de artículos en la tabla `cache` de SQLite; parseo de .md cacheado en .cache_articulos/parse/
 - Soporta Ollama /api/chat y /api/generate
 - Quality gate + auto-repair (1 reintento si sale corto o faltan secciones)
+- Llamadas a Ollama concurrentes por archivo (--concurrency, asyncio.gather + Semaphore)
+
+Para que Ollama atienda de verdad en paralelo, arráncalo con p.ej.:
+    OLLAMA_NUM_PARALLEL=8 OLLAMA_MAX_LOADED_MODELS=1 ollama serve
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import hashlib
 import json
+import os
+import random
 import re
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # opcional: (de)serialización JSON bastante más rápida
+except ImportError:
+    orjson = None
 
 
 # =========================
@@ -43,10 +60,141 @@ DB_PATH = SCRIPT_DIR / "blog.sqlite"
 
 REQUEST_TIMEOUT = 240
 RETRIES = 3
-SLEEP_BETWEEN_CALLS = 0.6
+BACKOFF_MAX = 30  # segundos; espera = min(BACKOFF_MAX, 2**intento) + jitter
+# Solo se reintenta lo transitorio: red, timeout, stream cortado, HTTP 5xx/429 y OllamaError
+_TRANSIENT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+CONCURRENCY_DEFAULT = 4  # peticiones simultáneas a Ollama (ajustar a OLLAMA_NUM_PARALLEL)
+READ_WORKERS = 8  # hilos para leer los .md en paralelo
+BAIL_CHECK_EVERY = 16  # cada cuántos trozos del stream se evalúa el corte anticipado
 
 CACHE_DIR = SCRIPT_DIR / ".cache_articulos"
 CACHE_DIR.mkdir(exist_ok=True)
+PARSE_CACHE_DIR = CACHE_DIR / "parse"  # H3Item parseados, por sha256 del .md
+PARSE_CACHE_DIR.mkdir(exist_ok=True)
+PARSE_CACHE_VERSION = 1  # subir al cambiar extract_h3_items / strip_numbering_from_h3 / H3Item
+
+# Sesión HTTP compartida: reutiliza conexiones keep-alive en vez de abrir un socket por llamada.
+# main() monta el pool con el tamaño de --concurrency (ver configure_http_pool).
+_SESSION = requests.Session()
+_SESSION.headers["Content-Type"] = "application/json"
+
+# Llamadas reales a Ollama (generación, batch, repair y fallbacks); se incrementa desde varios hilos
+_OLLAMA_CALLS = 0
+_OLLAMA_CALLS_LOCK = threading.Lock()
+
+INSERT_SQL = "INSERT OR IGNORE INTO posts(date, title, content, category) VALUES(?, ?, ?, ?)"
+CACHE_GET_SQL = "SELECT content, meta FROM cache WHERE key = ?"
+CACHE_PUT_SQL = "INSERT OR REPLACE INTO cache(key, meta, content) VALUES(?, ?, ?)"
+CACHE_IMPORT_SQL = "INSERT OR IGNORE INTO cache(key, meta, content) VALUES(?, ?, ?)"
+
+
+# =========================
+# REGEX (compiladas una vez; se usan en cada línea de cada .md)
+# =========================
+_RE_H1 = re.compile(r"^\s*#\s+(.+?)\s*$")
+_RE_H2 = re.compile(r"^\s*##\s+(.+?)\s*$")
+_RE_H3 = re.compile(r"^\s*###\s+(.+?)\s*$")
+_RE_HEADING12 = re.compile(r"^\s*#{1,2}\s+")
+_RE_FM_LINE = re.compile(r"^([A-Za-z0-9_-]+)\s*:\s*(.*)\s*$")
+_RE_LESSON_PREFIX = re.compile(r"^(lecci[oó]n|lesson|tema|cap[ií]tulo|unidad)\s*", re.IGNORECASE)
+_RE_NUMBERING = re.compile(r"^\s*\d+(?:[\.\-]\d+){0,6}\s*[\)\.\-–—:]*\s*")
+_RE_DASH = re.compile(r"^\s*[–—-]\s*")
+_RE_WS = re.compile(r"\s{2,}")
+_RE_WORD = re.compile(r"\w+")
+
+
+# =========================
+# PROMPTS (constantes: se formatean con format_map en cada llamada)
+# =========================
+_SYSTEM_WRITER = (
+    "Eres un redactor técnico senior especializado en IA aplicada a programación. "
+    "Escribes en español, con un tono claro, práctico y profesional para programadores. "
+    "No inventas enlaces, fuentes ni datos. No añades relleno innecesario."
+)
+
+_SYSTEM_EDITOR = (
+    "Eres un editor técnico senior. Mejoras artículos Markdown en español. "
+    "No inventas enlaces ni metes paja. Mantienes coherencia, y amplías si hace falta."
+)
+
+_USER_TEMPLATE = """CONTEXTO (sección relevante del temario):
+\"\"\"{ctx}\"\"\"
+
+METADATOS:
+- Categoría: {cat}
+- Título: "{title}"
+
+TAREA:
+Genera un artículo en Markdown. Longitud objetivo: 900–1400 palabras.
+
+FORMATO DE SALIDA (estricto):
+1) Primera línea: # {title}
+2) Segunda línea: **Meta:** <meta descripción 140–160 caracteres>
+3) Luego el contenido.
+
+Estructura mínima:
+- Introducción (por qué importa)
+- Explicación principal con ejemplos (incluye 1 bloque de código corto si ayuda)
+- Errores típicos / trampas (>=3)
+- Checklist accionable (5–10 puntos)
+- Siguientes pasos (2–4 bullets)
+
+REGLAS:
+- NO incluyas YAML front-matter.
+- NO incluyas enlaces inventados.
+- NO incluyas frases tipo “Aquí tienes…”.
+- Devuelve SOLO Markdown.
+"""
+
+_REPAIR_TEMPLATE = """El artículo siguiente ha fallado el control de calidad por: {reason}
+
+OBJETIVO (estricto):
+- Mantén el mismo tema y el mismo título.
+- Asegura que el artículo tenga entre 900–1400 palabras (si está corto, amplía con contenido útil).
+- Debe incluir: **Meta:**, sección de Errores, Checklist, y Siguientes pasos.
+- Añade ejemplos concretos y explicación más profunda (sin inventar fuentes/enlaces).
+- Devuelve SOLO Markdown.
+
+ARTÍCULO ACTUAL:
+\"\"\"{original}\"\"\"
+"""
+
+_BATCH_TEMPLATE = """CONTEXTO (secciones relevantes del temario, una por artículo):
+{contexts}
+
+METADATOS:
+- Categoría: {cat}
+- Títulos (uno por artículo, en este orden):
+{titles}
+
+TAREA:
+Genera {n} artículos en Markdown, uno por cada título. Longitud objetivo de cada uno: 900–1400 palabras.
+
+FORMATO DE SALIDA (estricto):
+Devuelve SOLO un array JSON, sin texto alrededor:
+[{{"title": "<título exacto>", "content_md": "<artículo en Markdown>"}}, ...]
+
+Cada content_md:
+1) Primera línea: # <título exacto>
+2) Segunda línea: **Meta:** <meta descripción 140–160 caracteres>
+3) Luego el contenido.
+
+Estructura mínima de cada artículo:
+- Introducción (por qué importa)
+- Explicación principal con ejemplos (incluye 1 bloque de código corto si ayuda)
+- Errores típicos / trampas (>=3)
+- Checklist accionable (5–10 puntos)
+- Siguientes pasos (2–4 bullets)
+
+REGLAS:
+- NO incluyas YAML front-matter.
+- NO incluyas enlaces inventados.
+- NO incluyas frases tipo “Aquí tienes…”.
+"""
 
 
 # =========================
@@ -61,6 +209,7 @@ class H3Item:
     h3_raw: str
     h3_title: str
     category: str
+    section_body: str = ""  # texto bajo el ### hasta el siguiente ###, ## o #
 
 
 # =========================
@@ -70,6 +219,29 @@ def now_iso() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    JSON en UTF-8 sin escapar caracteres no ASCII (como json.dumps(..., ensure_ascii=False)).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def configure_http_pool(size: int) -> None:
+    """
+    Un hueco del pool por hilo de generación; los reintentos los gestiona ollama_call.
+    """
+    size = max(1, size)
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size, max_retries=0)
+    _SESSION.mount("http://", adapter)
+    _SESSION.mount("https://", adapter)
+
+
 def normalize_newlines(s: str) -> str:
     return s.replace("\r\n", "\n").replace("\r", "\n")
 
@@ -78,8 +250,33 @@ def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="replace")
 
 
-def ensure_db(db_path: Path) -> None:
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Escribe a un temporal y lo renombra: un corte a mitad nunca deja un archivo a medias
+    que envenene ejecuciones posteriores.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def connect_db(db_path: Path) -> sqlite3.Connection:
+    """
+    Abre la DB con PRAGMAs pensados para un cache local de un solo host:
+    WAL + synchronous=NORMAL (1 fsync por checkpoint, no por commit; sigue siendo seguro ante crash),
+    temporales en memoria, 64 MiB de page cache y 256 MiB de mmap.
+    """
     conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    return conn
+
+
+def ensure_db(db_path: Path) -> None:
+    conn = connect_db(db_path)
     try:
         conn.execute(
             """
@@ -98,25 +295,73 @@ def ensure_db(db_path: Path) -> None:
         conn.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS idx_posts_title_category ON posts(title, category);"
         )
+        # cache de artículos generados (key = cache_key), incluidos los rechazados por QA
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, meta TEXT, content TEXT);")
         conn.commit()
+
+        n = import_legacy_cache(conn)
+        if n:
+            print(f"Cache: importados {n} artículos de {CACHE_DIR}/*.json a la tabla cache")
     finally:
         conn.close()
 
 
-def post_exists(conn: sqlite3.Connection, title: str, category: str) -> bool:
-    cur = conn.execute(
-        "SELECT 1 FROM posts WHERE title = ? AND category = ? LIMIT 1",
-        (title, category),
-    )
-    return cur.fetchone() is not None
+def import_legacy_cache(conn: sqlite3.Connection) -> int:
+    """
+    Importa (una sola vez) el cache antiguo de un .json por artículo en CACHE_DIR a la tabla cache.
+    El nombre del archivo es la misma clave que devuelve cache_key. Los importados se renombran
+    a *.json.migrated para no volver a leerlos; los ilegibles se dejan como están.
+    """
+    rows: List[Tuple[str, str, str]] = []
+    done: List[Path] = []
+    for p in sorted(CACHE_DIR.glob("*.json")):
+        try:
+            data = json_loads(p.read_bytes())
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        content = str(data.pop("content", "") or "")
+        rows.append((p.stem, json_dumps(data).decode("utf-8"), content))
+        done.append(p)
 
+    if rows:
+        with conn:
+            conn.executemany(CACHE_IMPORT_SQL, rows)
+    for p in done:
+        p.rename(p.with_name(f"{p.name}.migrated"))
+    return len(rows)
 
-def insert_post(conn: sqlite3.Connection, title: str, content_md: str, category: str) -> None:
-    conn.execute(
-        "INSERT INTO posts(date, title, content, category) VALUES(?, ?, ?, ?)",
-        (now_iso(), title, content_md, category),
-    )
-    conn.commit()
+
+class BlogDB:
+    """
+    Conexión + un cursor de inserción reutilizado.
+    El SQL (INSERT_SQL, CACHE_*_SQL) es siempre el mismo objeto str, así que sqlite3 reutiliza
+    la sentencia preparada.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.insert_cursor = conn.cursor()
+
+    def get_cache(self, key: str) -> Optional[Tuple[str, str]]:
+        """
+        (content, meta_json) del artículo cacheado con esa clave, o None.
+        """
+        return self.conn.execute(CACHE_GET_SQL, (key,)).fetchone()
+
+    def save(self, posts: List[Tuple[str, str, str, str]], cache_rows: List[Tuple[str, str, str]]) -> None:
+        """
+        Una sola transacción para:
+        - posts (date, title, content, category). OR IGNORE: si otro proceso ya insertó el mismo
+          (title, category), el índice UNIQUE lo descarta.
+        - cache (key, meta, content).
+        """
+        with self.conn:
+            if cache_rows:
+                self.insert_cursor.executemany(CACHE_PUT_SQL, cache_rows)
+            if posts:
+                self.insert_cursor.executemany(INSERT_SQL, posts)
 
 
 def strip_numbering_from_h3(title: str) -> str:
@@ -124,10 +369,10 @@ def strip_numbering_from_h3(title: str) -> str:
     "Lección 1.1.1 — Por qué ajustar pesos es difícil" -> "Por qué ajustar pesos es difícil"
     """
     t = title.strip()
-    t = re.sub(r"^(lecci[oó]n|lesson|tema|cap[ií]tulo|unidad)\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"^\s*\d+(?:[\.\-]\d+){0,6}\s*[\)\.\-–—:]*\s*", "", t)
-    t = re.sub(r"^\s*[–—-]\s*", "", t)
-    t = re.sub(r"\s{2,}", " ", t).strip()
+    t = _RE_LESSON_PREFIX.sub("", t)
+    t = _RE_NUMBERING.sub("", t)
+    t = _RE_DASH.sub("", t)
+    t = _RE_WS.sub(" ", t).strip()
     return t if t else title.strip()
 
 
@@ -148,7 +393,7 @@ def extract_front_matter(md: str) -> Tuple[Dict[str, str], str]:
         line = line.strip()
         if not line or line.startswith("#"):
             continue
-        m = re.match(r"^([A-Za-z0-9_-]+)\s*:\s*(.*)\s*$", line)
+        m = _RE_FM_LINE.match(line)
         if m:
             k = m.group(1).strip()
             v = m.group(2).strip().strip('"').strip("'")
@@ -157,199 +402,298 @@ def extract_front_matter(md: str) -> Tuple[Dict[str, str], str]:
     return fm, body
 
 
-def extract_h3_items(md_body: str, file_path: Path) -> List[H3Item]:
+def extract_h3_items(body_lines: Iterable[str], file_path: Path) -> List[H3Item]:
     """
-    Recorre el documento en orden y para cada ### captura el H1 y H2 más recientes.
+    Recorre el documento en orden (una sola pasada) y para cada ### captura el H1 y H2
+    más recientes y el texto de su sección (hasta el siguiente ### o un ##/#).
+    body_lines debe venir ya con saltos de línea normalizados (ver parse_markdown).
     """
-    h1_current = ""
-    h2_current = ""
+    no_h1 = "Sin sección principal"
+    no_h2 = "Sin subsección"
     items: List[H3Item] = []
 
+    current: Optional[H3Item] = None
+    buf: List[str] = []
+
     file_stem = file_path.stem.strip() or file_path.name
 
-    for line in normalize_newlines(md_body).splitlines():
-        m1 = re.match(r"^\s*#\s+(.+?)\s*$", line)
+    # H1/H2 efectivos y "<archivo>, <H1>, <H2>": solo se recalculan cuando cambia un # o ##
+    h1 = no_h1
+    h2 = no_h2
+    cat_prefix = f"{file_stem}, {h1}, {h2}"
+
+    def close_section() -> None:
+        nonlocal current
+        if current is not None:
+            current.section_body = "\n".join(buf)
+            buf.clear()
+            current = None
+
+    for line in body_lines:
+        m1 = _RE_H1.match(line)
         if m1:
-            h1_current = m1.group(1).strip()
-            h2_current = ""
+            close_section()
+            h1 = m1.group(1).strip() or no_h1
+            h2 = no_h2
+            cat_prefix = f"{file_stem}, {h1}, {h2}"
             continue
 
-        m2 = re.match(r"^\s*##\s+(.+?)\s*$", line)
+        m2 = _RE_H2.match(line)
         if m2:
-            h2_current = m2.group(1).strip()
+            close_section()
+            h2 = m2.group(1).strip() or no_h2
+            cat_prefix = f"{file_stem}, {h1}, {h2}"
             continue
 
-        m3 = re.match(r"^\s*###\s+(.+?)\s*$", line)
+        m3 = _RE_H3.match(line)
         if m3:
+            close_section()
             raw_h3 = m3.group(1).strip()
             title = strip_numbering_from_h3(raw_h3)
 
-            h1 = h1_current.strip() if h1_current.strip() else "Sin sección principal"
-            h2 = h2_current.strip() if h2_current.strip() else "Sin subsección"
-            category = f"{file_stem}, {h1}, {h2}"
-
-            items.append(
-                H3Item(
-                    file_path=file_path,
-                    file_stem=file_stem,
-                    h1=h1,
-                    h2=h2,
-                    h3_raw=raw_h3,
-                    h3_title=title,
-                    category=category,
-                )
+            current = H3Item(
+                file_path=file_path,
+                file_stem=file_stem,
+                h1=h1,
+                h2=h2,
+                h3_raw=raw_h3,
+                h3_title=title,
+                category=cat_prefix,
             )
+            items.append(current)
+            continue
+
+        # "#"/"##" sin texto también cierran la sección
+        if _RE_HEADING12.match(line):
+            close_section()
+            continue
 
+        if current is not None:
+            buf.append(line)
+
+    close_section()
     return items
 
 
-def extract_section_context(md_body: str, h1: str, h2: str, h3_raw: str, max_chars: int = 12000) -> str:
+def extract_section_context(it: H3Item, max_chars: int = 12000) -> str:
     """
     Contexto centrado en el H3:
     - Encabezados (#, ##, ###) para situar el tema
-    - Texto desde ese ### hasta antes del siguiente ### o un ##/#
+    - Texto de la sección ya capturado por extract_h3_items
     """
-    lines = normalize_newlines(md_body).splitlines()
-    out: List[str] = []
-    in_block = False
-    found = False
-
-    for line in lines:
-        m3 = re.match(r"^\s*###\s+(.+?)\s*$", line)
-        if m3:
-            current = m3.group(1).strip()
-            if current == h3_raw:
-                in_block = True
-                found = True
-                continue
-            elif in_block:
-                break
+    header = f"# {it.h1}\n## {it.h2}\n### {it.h3_raw}\n"
+    chunk = (header + it.section_body).strip()
 
-        if in_block and re.match(r"^\s*#{1,2}\s+", line):
-            break
+    if len(chunk) > max_chars:
+        chunk = chunk[:max_chars].rstrip() + "\n\n*(Contexto truncado por límite de tamaño)*\n"
 
-        if in_block:
-            out.append(line)
+    return chunk
 
-    header = f"# {h1}\n## {h2}\n### {h3_raw}\n"
-    chunk = (header + "\n".join(out)).strip()
 
-    if not found:
-        chunk = header.strip()
+def parse_markdown(raw: str, file_path: Path) -> List[H3Item]:
+    """
+    Front-matter + extract_h3_items, memoizado en PARSE_CACHE_DIR.
+    La clave es el sha256 de PARSE_CACHE_VERSION + nombre + contenido del archivo: si se edita el
+    archivo (o cambia el parser y se sube la versión), el cache se invalida solo.
+    """
+    h = hashlib.sha256(f"{PARSE_CACHE_VERSION}\n{file_path.name}\n{raw}".encode("utf-8")).hexdigest()
+    pc = PARSE_CACHE_DIR / f"{h}.json"
+    if pc.is_file():
+        try:
+            data = json_loads(pc.read_bytes())
+            return [H3Item(**{**d, "file_path": file_path}) for d in data]
+        except (OSError, ValueError, TypeError):
+            pass  # ilegible o de otro esquema: se vuelve a parsear y se sobrescribe
 
-    if len(chunk) > max_chars:
-        chunk = chunk[:max_chars].rstrip() + "\n\n*(Contexto truncado por límite de tamaño)*\n"
+    # extract_front_matter ya normaliza los saltos de línea: aquí solo se parte en líneas, una vez
+    _fm, body = extract_front_matter(raw)
+    items = extract_h3_items(body.splitlines(), file_path=file_path)
 
-    return chunk
+    data = [{**asdict(it), "file_path": str(it.file_path)} for it in items]
+    write_bytes_atomic(pc, json_dumps(data))
+    return items
 
 
 def build_prompt(section_context: str, category: str, article_title: str) -> Tuple[str, str]:
-    system = (
-        "Eres un redactor técnico senior especializado en IA aplicada a programación. "
-        "Escribes en español, con un tono claro, práctico y profesional para programadores. "
-        "No inventas enlaces, fuentes ni datos. No añades relleno innecesario."
-    )
+    user = _USER_TEMPLATE.format_map({"ctx": section_context, "cat": category, "title": article_title})
+    return _SYSTEM_WRITER, user
 
-    user = f"""CONTEXTO (sección relevante del temario):
-\"\"\"{section_context}\"\"\"
 
-METADATOS:
-- Categoría: {category}
-- Título: "{article_title}"
+def repair_prompt(original_md: str, title: str, reason: str) -> Tuple[str, str]:
+    user = _REPAIR_TEMPLATE.format_map({"reason": reason, "original": original_md})
+    return _SYSTEM_EDITOR, user
 
-TAREA:
-Genera un artículo en Markdown. Longitud objetivo: 900–1400 palabras.
 
-FORMATO DE SALIDA (estricto):
-1) Primera línea: # {article_title}
-2) Segunda línea: **Meta:** <meta descripción 140–160 caracteres>
-3) Luego el contenido.
+def build_batch_prompt(items: List[H3Item]) -> Tuple[str, str]:
+    """
+    Un único prompt para varios H3 con el mismo H1/H2 (misma categoría): el system prompt y el
+    contexto común se procesan una vez. La respuesta debe ser un array JSON (ver parse_batch_response).
+    """
+    contexts = "\n\n".join(f'"""{extract_section_context(it)}"""' for it in items)
+    titles = "\n".join(f'- "{it.h3_title}"' for it in items)
 
-Estructura mínima:
-- Introducción (por qué importa)
-- Explicación principal con ejemplos (incluye 1 bloque de código corto si ayuda)
-- Errores típicos / trampas (>=3)
-- Checklist accionable (5–10 puntos)
-- Siguientes pasos (2–4 bullets)
+    user = _BATCH_TEMPLATE.format_map(
+        {"contexts": contexts, "cat": items[0].category, "titles": titles, "n": len(items)}
+    )
+    return _SYSTEM_WRITER, user
 
-REGLAS:
-- NO incluyas YAML front-matter.
-- NO incluyas enlaces inventados.
-- NO incluyas frases tipo “Aquí tienes…”.
-- Devuelve SOLO Markdown.
-"""
-    return system, user
 
+def parse_batch_response(text: str, items: List[H3Item]) -> Dict[str, str]:
+    """
+    Extrae {h3_title: content_md} del array JSON devuelto por el modelo (tolera ```json alrededor).
+    - Empareja por título, sin usar dos veces el mismo artículo.
+    - Solo si ningún título coincide y hay tantos artículos como items, empareja por posición.
+    - Descarta los artículos cuyo H1 no es el título esperado (respuestas desordenadas).
+    Los items que no aparezcan en el resultado se generan uno a uno.
+    Lanza ValueError si la respuesta no es un array JSON válido.
+    """
+    start = text.find("[")
+    end = text.rfind("]")
+    if start < 0 or end < start:
+        raise ValueError("La respuesta no contiene un array JSON")
+
+    data = json_loads(text[start : end + 1])
+    if not isinstance(data, list):
+        raise ValueError("La respuesta no es un array JSON")
+
+    arts = [
+        (str(d.get("title") or "").strip(), str(d.get("content_md") or "").strip())
+        for d in data
+        if isinstance(d, dict)
+    ]
+
+    out: Dict[str, str] = {}
+    used: set = set()
+    for it in items:
+        for j, (t, c) in enumerate(arts):
+            if j not in used and c and t == it.h3_title:
+                out[it.h3_title] = c
+                used.add(j)
+                break
 
-def repair_prompt(original_md: str, title: str, reason: str) -> Tuple[str, str]:
-    system = (
-        "Eres un editor técnico senior. Mejoras artículos Markdown en español. "
-        "No inventas enlaces ni metes paja. Mantienes coherencia, y amplías si hace falta."
-    )
-    user = f"""El artículo siguiente ha fallado el control de calidad por: {reason}
+    if not used and len(arts) == len(items):
+        for (t, c), it in zip(arts, items):
+            if c:
+                print(f"  - (batch) título no coincide, se empareja por posición: {t!r} → {it.h3_title!r}")
+                out[it.h3_title] = c
 
-OBJETIVO (estricto):
-- Mantén el mismo tema y el mismo título.
-- Asegura que el artículo tenga entre 900–1400 palabras (si está corto, amplía con contenido útil).
-- Debe incluir: **Meta:**, sección de Errores, Checklist, y Siguientes pasos.
-- Añade ejemplos concretos y explicación más profunda (sin inventar fuentes/enlaces).
-- Devuelve SOLO Markdown.
+    for title, c in list(out.items()):
+        m = _RE_H1.match(c.split("\n", 1)[0])
+        if not m or m.group(1).strip() != title:
+            print(f"  - (batch) el H1 no es {title!r}: se generará aparte")
+            del out[title]
+
+    return out
+
+
+class OllamaError(RuntimeError):
+    """
+    Error transitorio reportado por Ollama (línea {"error": ...} en el stream o respuesta vacía).
+    """
 
-ARTÍCULO ACTUAL:
-\"\"\"{original_md}\"\"\"
-"""
-    return system, user
 
+def off_format(partial_md: str) -> bool:
+    """
+    Predicado de corte para ollama_call: el artículo debe empezar por "# " (ver quality_check).
+    Si el modelo arranca con otra cosa ("Aquí tienes…", ```markdown, etc.) el QA lo va a
+    rechazar igualmente, así que no merece la pena esperar a que termine.
+    """
+    t = partial_md.lstrip()
+    return len(t) >= 2 and not t.startswith("# ")
 
-def ollama_call(model: str, url: str, system: str, user: str) -> str:
+
+def ollama_call(
+    model: str, url: str, system: str, user: str, bail: Optional[Callable[[str], bool]] = None
+) -> str:
     """
-    Soporta /api/chat y /api/generate según la URL.
-    - chat: devuelve {"message":{"content":"..."}}
-    - generate: devuelve {"response":"..."}
+    Soporta /api/chat y /api/generate según la URL, en streaming (una línea JSON por trozo):
+    - chat: {"message":{"content":"..."}, "done": ...}
+    - generate: {"response":"...", "done": ...}
+    Si se pasa bail, se evalúa sobre el texto acumulado cada BAIL_CHECK_EVERY trozos; si devuelve
+    True se cierra la conexión (Ollama deja de generar) y se devuelve lo recibido hasta entonces.
     """
+    is_chat = url.endswith("/api/chat")
+    options = {"temperature": 0.7, "top_p": 0.9, "num_ctx": 8192}
+    if is_chat:
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            "stream": True,
+            "options": options,
+        }
+    else:
+        payload = {
+            "model": model,
+            "prompt": f"{system}\n\n{user}",
+            "stream": True,
+            "options": options,
+        }
+
+    global _OLLAMA_CALLS
+    with _OLLAMA_CALLS_LOCK:
+        _OLLAMA_CALLS += 1
+
     last_err = None
 
     for attempt in range(1, RETRIES + 1):
         try:
-            if url.endswith("/api/chat"):
-                payload = {
-                    "model": model,
-                    "messages": [
-                        {"role": "system", "content": system},
-                        {"role": "user", "content": user},
-                    ],
-                    "stream": False,
-                    "options": {"temperature": 0.7, "top_p": 0.9, "num_ctx": 8192},
-                }
-                r = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+            parts: List[str] = []
+            with _SESSION.post(url, json=payload, stream=True, timeout=REQUEST_TIMEOUT) as r:
                 r.raise_for_status()
-                data = r.json()
-                text = ((data.get("message") or {}).get("content") or "").strip()
-            else:
-                payload = {
-                    "model": model,
-                    "prompt": f"{system}\n\n{user}",
-                    "stream": False,
-                    "options": {"temperature": 0.7, "top_p": 0.9, "num_ctx": 8192},
-                }
-                r = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
-                r.raise_for_status()
-                data = r.json()
-                text = (data.get("response") or "").strip()
+                for n, line in enumerate(r.iter_lines(), 1):
+                    if not line:
+                        continue
+                    chunk = json_loads(line)
+                    if chunk.get("error"):
+                        raise OllamaError(f"Ollama: {chunk['error']}")
+                    if is_chat:
+                        parts.append((chunk.get("message") or {}).get("content") or "")
+                    else:
+                        parts.append(chunk.get("response") or "")
+                    if chunk.get("done"):
+                        break
+                    if bail is not None and n % BAIL_CHECK_EVERY == 0 and bail("".join(parts)):
+                        break  # al salir del with se cierra la conexión y se cancela la generación
 
+            text = "".join(parts).strip()
             if not text:
-                raise RuntimeError("Respuesta vacía de Ollama.")
+                raise OllamaError("Respuesta vacía de Ollama.")
             return text
 
-        except Exception as e:
-            last_err = e
-            time.sleep(1.0 * attempt)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is None or not (status >= 500 or status == 429):
+                print(f"  - (ollama) HTTP {status}, no se reintenta: {e}")
+                raise
+            last_err = e  # 5xx / 429: transitorio
+        except (*_TRANSIENT_ERRORS, OllamaError) as e:
+            last_err = e  # conexión, timeout, stream cortado, error de Ollama o respuesta vacía
+
+        if attempt < RETRIES:
+            # Backoff exponencial con jitter: evita que los hilos concurrentes reintenten a la vez
+            wait = min(BACKOFF_MAX, 2**attempt) + random.random() * 0.5
+            print(f"  - (ollama) intento {attempt}/{RETRIES} falló ({last_err}); reintento en {wait:.1f}s")
+            time.sleep(wait)
 
     raise RuntimeError(f"Fallo llamando a Ollama tras {RETRIES} intentos: {last_err}")
 
 
-def approx_word_count(md: str) -> int:
-    return len(re.findall(r"\w+", md))
+def approx_word_count(md: str, stop_at: int = 0) -> int:
+    """
+    Cuenta palabras sin construir la lista completa de findall.
+    Con stop_at > 0 deja de contar al llegar a ese número (al QA solo le importa el umbral).
+    """
+    matches = _RE_WORD.finditer(md)
+    if stop_at > 0:
+        matches = islice(matches, stop_at)
+    return sum(1 for _ in matches)
+
+
+# Secciones obligatorias (fijadas en el prompt), con su versión en minúsculas precalculada
+_QA_NEEDED = [(k, k.lower()) for k in ("**Meta:**", "Errores", "Checklist", "Siguientes pasos")]
 
 
 def quality_check(md: str, min_words: int) -> Tuple[bool, str]:
@@ -358,29 +702,143 @@ def quality_check(md: str, min_words: int) -> Tuple[bool, str]:
     if not text.startswith("# "):
         return False, "No empieza con H1 (# ...)"
 
-    wc = approx_word_count(text)
+    wc = approx_word_count(text, stop_at=min_words)
     if wc < min_words:
         return False, f"Muy corto (~{wc} palabras)"
 
-    needed = ["**Meta:**", "Errores", "Checklist", "Siguientes pasos"]
-    missing = [k for k in needed if k.lower() not in text.lower()]
+    low = text.lower()
+    missing = [k for k, k_low in _QA_NEEDED if k_low not in low]
     if missing:
         return False, f"Faltan secciones: {missing}"
 
     # Anti-repetición básica
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    if lines:
-        top = max((lines.count(ln) for ln in set(lines)), default=1)
+    if len(lines) >= 6:  # con menos líneas no puede haber 6 repetidas
+        top = Counter(lines).most_common(1)[0][1]
         if top >= 6:
             return False, "Repetición excesiva de líneas"
 
     return True, "OK"
 
 
-def cache_path(file_path: Path, title: str, category: str, model: str) -> Path:
+def cache_key(file_path: Path, title: str, category: str, model: str) -> str:
     key = f"{file_path.name}||{title}||{category}||{model}"
-    h = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
-    return CACHE_DIR / f"{h}.json"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+
+def finish_article(
+    it: H3Item, content_md: str, model: str, url: str, min_words: int, repair: bool
+) -> Tuple[str, bool, str]:
+    """
+    QA + auto-repair (1 reintento) sobre un artículo ya generado. Devuelve (content_md, ok, reason).
+    """
+    ok, reason = quality_check(content_md, min_words)
+
+    # Auto-repair si procede
+    if (not ok) and repair and ("Muy corto" in reason or "Faltan secciones" in reason):
+        system2, user2 = repair_prompt(content_md, it.h3_title, reason)
+        print(f"  - (repair) {it.h3_title}: {reason}")
+        content_md2 = ollama_call(model, url, system2, user2, bail=off_format)
+        ok2, reason2 = quality_check(content_md2, min_words)
+        if ok2:
+            content_md = content_md2
+            ok, reason = ok2, reason2
+        else:
+            reason = f"{reason} | Repair falló: {reason2}"
+
+    return content_md, ok, reason
+
+
+def generate_article(
+    it: H3Item, model: str, url: str, min_words: int, repair: bool
+) -> Tuple[str, bool, str]:
+    """
+    Genera (y si procede repara) el artículo de un H3. Devuelve (content_md, ok, reason).
+    Se ejecuta en un hilo: no toca SQLite ni el cache.
+    """
+    section_ctx = extract_section_context(it)
+    system, user = build_prompt(section_ctx, it.category, it.h3_title)
+    content_md = ollama_call(model, url, system, user, bail=off_format)
+    return finish_article(it, content_md, model, url, min_words, repair)
+
+
+def generate_batch(
+    group: List[H3Item], model: str, url: str, min_words: int, repair: bool
+) -> List[Tuple[str, bool, str]]:
+    """
+    Genera varios artículos de la misma categoría con una sola llamada a Ollama.
+    Los que no se puedan extraer de la respuesta (JSON roto, título ausente) se generan uno a uno.
+    """
+    system, user = build_batch_prompt(group)
+    raw = ollama_call(model, url, system, user)
+    try:
+        arts = parse_batch_response(raw, group)
+    except ValueError as e:
+        print(f"  - (batch fallback) [{group[0].category}]: {e}")
+        arts = {}
+
+    results: List[Tuple[str, bool, str]] = []
+    for it in group:
+        content_md = arts.get(it.h3_title)
+        if content_md:
+            results.append(finish_article(it, content_md, model, url, min_words, repair))
+        else:
+            results.append(generate_article(it, model, url, min_words, repair))
+    return results
+
+
+def group_jobs(jobs: List[H3Item], batch_size: int) -> List[List[H3Item]]:
+    """
+    Agrupa los jobs por categoría (mismo archivo + H1 + H2), en trozos de hasta batch_size.
+    """
+    by_cat: Dict[str, List[H3Item]] = {}
+    for it in jobs:
+        by_cat.setdefault(it.category, []).append(it)
+
+    size = max(1, batch_size)
+    return [items[i : i + size] for items in by_cat.values() for i in range(0, len(items), size)]
+
+
+async def generate_all(
+    jobs: List[H3Item],
+    args: argparse.Namespace,
+    on_done: Callable[[List[Tuple[H3Item, object]]], None],
+) -> None:
+    """
+    Lanza todos los jobs a la vez, limitados por un Semaphore(args.concurrency).
+    Con --batch-size > 1, los H3 de la misma categoría van juntos en una sola petición.
+    Cada vez que termina un grupo llama a on_done con sus (item, resultado), donde resultado es
+    (content_md, ok, reason) o la excepción que lo hizo fallar. on_done corre en el hilo del
+    event loop (el principal), así que puede escribir en SQLite sin esperar al resto.
+    """
+    concurrency = max(1, args.concurrency)
+    # El executor por defecto de asyncio tiene como mucho min(32, cpus + 4) hilos:
+    # se sustituye por uno del tamaño de --concurrency (asyncio.run lo cierra al terminar).
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    sem = asyncio.Semaphore(concurrency)
+    groups = group_jobs(jobs, args.batch_size)
+
+    async def run(group: List[H3Item]) -> Tuple[List[H3Item], object]:
+        try:
+            async with sem:
+                if len(group) == 1:
+                    res = await asyncio.to_thread(
+                        generate_article, group[0], args.model, args.ollama_url, args.min_words, args.repair
+                    )
+                    return group, [res]
+                res_list = await asyncio.to_thread(
+                    generate_batch, group, args.model, args.ollama_url, args.min_words, args.repair
+                )
+                return group, res_list
+        except Exception as e:
+            return group, e
+
+    for fut in asyncio.as_completed([run(g) for g in groups]):
+        group, res = await fut
+        if isinstance(res, BaseException):
+            on_done([(it, res) for it in group])
+        else:
+            on_done(list(zip(group, res)))
 
 
 # =========================
@@ -390,16 +848,24 @@ def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--model", default=MODEL_DEFAULT)
     ap.add_argument("--ollama-url", default=OLLAMA_URL_DEFAULT)
-    ap.add_argument("--dry-run", action="store_true", help="No escribe en DB (solo simula).")
+    ap.add_argument("--dry-run", action="store_true", help="No inserta posts en DB (solo simula; el cache sí se guarda).")
     ap.add_argument("--limit", type=int, default=0, help="Máximo de artículos a generar (0 = sin límite).")
     ap.add_argument("--min-words", type=int, default=200, help="Mínimo de palabras aproximadas para pasar QA.")
     ap.add_argument("--repair", action="store_true", default=True, help="Reintenta 1 vez si falla QA por corto/secciones.")
+    ap.add_argument("--concurrency", type=int, default=CONCURRENCY_DEFAULT, help="Llamadas simultáneas a Ollama.")
+    ap.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Artículos por llamada agrupando H3 con el mismo H1/H2 (1 = sin agrupar; ojo con num_ctx).",
+    )
     args = ap.parse_args()
 
     if not DOCS_DIR.is_dir():
         raise SystemExit(f"ERROR: No existe la carpeta: {DOCS_DIR}")
 
     ensure_db(DB_PATH)
+    configure_http_pool(args.concurrency)
 
     md_files = sorted([p for p in DOCS_DIR.glob("*.md") if p.is_file()])
     if not md_files:
@@ -411,115 +877,159 @@ def main() -> None:
     print(f"Modelo: {args.model}")
     print(f"Ollama: {args.ollama_url}")
     print(f"QA: min_words={args.min_words} | repair={args.repair}")
+    print(f"Concurrencia: {args.concurrency} | batch-size={args.batch_size}")
     print("-" * 70)
 
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = connect_db(DB_PATH)
+    db = BlogDB(conn)
     try:
+        # Dedupe en memoria: una sola consulta en vez de un SELECT por H3
+        seen = {(t, c) for t, c in conn.execute("SELECT title, category FROM posts")}
+
         inserted = 0
         skipped = 0
         rejected = 0
         generated = 0
 
-        for md_path in md_files:
-            raw = read_text(md_path)
-            _fm, body = extract_front_matter(raw)
+        # Lecturas solapadas: con cache frío la latencia de disco no se paga archivo a archivo
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as ex:
+            raws = list(ex.map(read_text, md_files))
 
-            items = extract_h3_items(body, file_path=md_path)
+        for md_path, raw in zip(md_files, raws):
+            items = parse_markdown(raw, md_path)
             if not items:
                 print(f"[SKIP] {md_path.name}: no hay headings ###")
                 continue
 
             print(f"\n[{md_path.name}] H3 encontrados: {len(items)}")
 
+            jobs: List[H3Item] = []
+            pending: List[Tuple[str, str, str, str]] = []  # filas de posts para db.save al final del archivo
+            cache_rows: List[Tuple[str, str, str]] = []  # filas (key, meta, content) para la tabla cache
+            queued: set = set()  # (title, category) ya encolados: seen solo se actualiza tras el gather
             for it in items:
-                if args.limit and generated >= args.limit:
+                if args.limit and generated + len(jobs) >= args.limit:
                     print("\n[STOP] Alcanzado --limit")
                     break
 
                 title = it.h3_title
                 category = it.category
 
-                if post_exists(conn, title, category):
+                if (title, category) in seen:
                     skipped += 1
                     print(f"  - (skip) Ya existe: [{category}] {title}")
                     continue
 
-                ck = cache_path(md_path, title, category, args.model)
-                if ck.is_file():
+                if (title, category) in queued:
+                    skipped += 1
+                    print(f"  - (skip) Duplicado en el archivo: [{category}] {title}")
+                    continue
+
+                ck = cache_key(md_path, title, category, args.model)
+                cached = db.get_cache(ck)
+                if cached is not None:
+                    content_md = (cached[0] or "").strip()
                     try:
-                        cached = json.loads(ck.read_text(encoding="utf-8"))
-                        content_md = (cached.get("content") or "").strip()
-                        ok, reason = quality_check(content_md, args.min_words) if content_md else (False, "Cache vacío")
+                        cached_meta = json_loads(cached[1] or "{}")
+                    except ValueError:
+                        cached_meta = {}
+
+                    if not content_md:
+                        ok, reason = False, "Cache vacío"
+                    elif cached_meta.get("ok") and cached_meta.get("min_words", 0) >= args.min_words:
+                        # Ya pasó QA con un umbral igual o más exigente: no hace falta repetirlo
+                        ok, reason = True, "OK"
+                    else:
+                        ok, reason = quality_check(content_md, args.min_words)
                         if ok:
-                            if not args.dry_run:
-                                insert_post(conn, title, content_md, category)
-                            inserted += 1
-                            print(f"  - (cache→db) [{category}] {title}")
-                            continue
-                        else:
-                            print(f"  - (cache reject) {title}: {reason} (regenerando)")
-                    except Exception:
-                        pass
-
-                # Contexto centrado
-                section_ctx = extract_section_context(body, it.h1, it.h2, it.h3_raw)
-                system, user = build_prompt(section_ctx, category, title)
-
-                print(f"  - (gen) [{category}] {title}")
-                content_md = ollama_call(args.model, args.ollama_url, system, user)
-                generated += 1
-
-                ok, reason = quality_check(content_md, args.min_words)
-
-                # Auto-repair si procede
-                if (not ok) and args.repair and ("Muy corto" in reason or "Faltan secciones" in reason):
-                    system2, user2 = repair_prompt(content_md, title, reason)
-                    print(f"  - (repair) {title}: {reason}")
-                    content_md2 = ollama_call(args.model, args.ollama_url, system2, user2)
-                    ok2, reason2 = quality_check(content_md2, args.min_words)
-                    if ok2:
-                        content_md = content_md2
-                        ok, reason = ok2, reason2
+                            # Guarda el nuevo veredicto para no repetir el QA en la próxima ejecución
+                            meta = {**cached_meta, "ok": ok, "reason": reason, "min_words": args.min_words}
+                            cache_rows.append((ck, json_dumps(meta).decode("utf-8"), content_md))
+
+                    if ok:
+                        pending.append((now_iso(), title, content_md, category))
+                        seen.add((title, category))
+                        inserted += 1
+                        print(f"  - (cache→db) [{category}] {title}")
+                        continue
                     else:
-                        reason = f"{reason} | Repair falló: {reason2}"
-
-                meta = {
-                    "source_file": md_path.name,
-                    "category": category,
-                    "title": title,
-                    "generated_at": now_iso(),
-                    "model": args.model,
-                    "ok": ok,
-                    "reason": reason,
-                    "hierarchy": {"h1": it.h1, "h2": it.h2, "h3_raw": it.h3_raw},
-                    "ollama_url": args.ollama_url,
-                }
-
-                ck.write_text(
-                    json.dumps({**meta, "content": content_md}, ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
-
-                if not ok:
-                    rejected += 1
-                    print(f"  - (reject) {title}: {reason}")
-                    continue
-
-                if not args.dry_run:
-                    insert_post(conn, title, content_md, category)
+                        print(f"  - (cache reject) {title}: {reason} (regenerando)")
 
-                inserted += 1
-                time.sleep(SLEEP_BETWEEN_CALLS)
+                print(f"  - (gen) [{category}] {title}")
+                jobs.append(it)
+                queued.add((title, category))
+
+            first_err: Optional[BaseException] = None
+
+            def flush() -> None:
+                # El cache se guarda también en dry-run para no perder lo generado
+                db.save([] if args.dry_run else pending, cache_rows)
+                pending.clear()
+                cache_rows.clear()
+
+            def save_results(done: List[Tuple[H3Item, object]]) -> None:
+                """
+                Procesa un grupo recién terminado y lo guarda ya: un Ctrl-C o un fallo a mitad de
+                archivo no pierde lo generado hasta entonces.
+                """
+                nonlocal inserted, rejected, first_err
+                for it, res in done:
+                    if isinstance(res, BaseException):
+                        first_err = first_err or res
+                        print(f"  - (error) {it.h3_title}: {res}")
+                        continue
+
+                    content_md, ok, reason = res
+                    title = it.h3_title
+                    category = it.category
+
+                    meta = {
+                        "source_file": md_path.name,
+                        "category": category,
+                        "title": title,
+                        "generated_at": now_iso(),
+                        "model": args.model,
+                        "ok": ok,
+                        "reason": reason,
+                        "min_words": args.min_words,
+                        "hierarchy": {"h1": it.h1, "h2": it.h2, "h3_raw": it.h3_raw},
+                        "ollama_url": args.ollama_url,
+                    }
+
+                    ck = cache_key(md_path, title, category, args.model)
+                    cache_rows.append((ck, json_dumps(meta).decode("utf-8"), content_md))
+
+                    if not ok:
+                        rejected += 1
+                        print(f"  - (reject) {title}: {reason}")
+                        continue
+
+                    pending.append((now_iso(), title, content_md, category))
+                    seen.add((title, category))
+                    inserted += 1
+
+                flush()
+
+            generated += len(jobs)
+            try:
+                if jobs:
+                    asyncio.run(generate_all(jobs, args, save_results))
+            finally:
+                flush()  # hits de cache sin jobs, o lo pendiente si algo se interrumpió
+
+            if first_err is not None:
+                raise first_err
 
             if args.limit and generated >= args.limit:
                 break
 
         print("\n" + "=" * 70)
-        print(f"Generados (llamadas a IA): {generated}")
+        print(f"Generados (artículos pedidos a IA): {generated}")
+        print(f"Llamadas a IA (incl. repair y fallbacks): {_OLLAMA_CALLS}")
         print(f"Insertados: {inserted}")
         print(f"Saltados (ya existían): {skipped}")
         print(f"Rechazados (QA): {rejected}")
-        print(f"Cache: {CACHE_DIR}")
+        print(f"Cache: tabla cache en {DB_PATH} | parseo en {PARSE_CACHE_DIR}")
         print("=" * 70)
 
     finally: